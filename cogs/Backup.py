@@ -3,21 +3,15 @@ from discord import Interaction, app_commands
 from discord.ext import commands, tasks
 import os
 import hashlib
-from dotenv import load_dotenv
-from typing import Optional
 from jsonDB import JsonDB
 from datetime import datetime, timezone
 import json
 
-# Load environment variables from a .env file
-load_dotenv()
-DATABASE: Optional[str] = os.getenv('DATABASE')
-
 
 class Backup(commands.Cog):
     def __init__(self, client: commands.Bot) -> None:
         self.client = client
-        self.db = JsonDB(DATABASE)  # Initialize the JSON database
+        self.db = JsonDB(client.settings.database)  # Initialize the JSON database
         self.backup_task.start()  # Start the backup task loop
 
     def cog_unload(self):
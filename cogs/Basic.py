@@ -1,14 +1,6 @@
 import discord
 from discord import Interaction, app_commands
 from discord.ext import commands
-import os
-from dotenv import load_dotenv
-from typing import Optional
-from main import COG_DIR
-
-# Load environment variables from a .env file
-load_dotenv()
-DEVELOPER: Optional[int] = int(os.getenv('DEVELOPER')) if os.getenv('DEVELOPER') else None
 
 
 class Basic(commands.Cog):
@@ -22,7 +14,7 @@ class Basic(commands.Cog):
         """Command to sync application commands with Discord."""
         await interaction.response.defer(ephemeral=True)
 
-        if interaction.user.id != DEVELOPER:
+        if interaction.user.id != self.client.settings.developer:
             await interaction.followup.send("Only the developer can use this command.")
             return
 
@@ -37,14 +29,13 @@ class Basic(commands.Cog):
         """Command to refresh all command cogs."""
         await interaction.response.defer(ephemeral=True)
 
-        if interaction.user.id != DEVELOPER:
+        if interaction.user.id != self.client.settings.developer:
             await interaction.followup.send("Only the developer can use this command.")
             return
 
         msg = await interaction.followup.send("Refreshing...")
-        for cog_file in COG_DIR.glob("*.py"):
-            if cog_file.stem not in ["__init__", "Utils"]:
-                await self.client.reload_extension(f"cogs.{cog_file.stem}")
+        for extension in self.client.settings.extensions:
+            await self.client.reload_extension(extension)
         await msg.edit(content="Commands refreshed!")
 
     @app_commands.command(name="ping", description="To check bot latency")
@@ -54,7 +45,7 @@ class Basic(commands.Cog):
         """Command to check the bot's latency."""
         await interaction.response.defer(ephemeral=True)
 
-        if interaction.user.id != DEVELOPER:
+        if interaction.user.id != self.client.settings.developer:
             await interaction.followup.send("Only the developer can use this command.")
             return
 
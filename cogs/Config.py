@@ -3,21 +3,14 @@ import discord
 from discord import Interaction, app_commands, Embed
 from discord.ext import commands
 from jsonDB import JsonDB
-import os
-from dotenv import load_dotenv
-from typing import Optional
 from .Utils import Utils
 
-# Load environment variables from a .env file
-load_dotenv()
-DATABASE: Optional[str] = os.getenv('DATABASE')
-
 
 class DashboardControls(discord.ui.View):
     def __init__(self, client):
         super().__init__(timeout=None)
         self.client = client
-        self.db = JsonDB(DATABASE)  # Initialize the JSON database
+        self.db = JsonDB(client.settings.database)  # Initialize the JSON database
 
         # Log channel selection menu
         self.log_channel_select = discord.ui.ChannelSelect(
@@ -1,13 +1,6 @@
 import discord
 from discord import Interaction, app_commands
 from discord.ext import commands
-from dotenv import load_dotenv
-import os
-from typing import Optional
-
-# Load environment variables from a .env file
-load_dotenv()
-TOKEN: Optional[str] = os.getenv('TOKEN')
 
 
 class HelloButton(discord.ui.View):
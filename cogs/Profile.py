@@ -0,0 +1,219 @@
+import discord
+from discord import Interaction, app_commands
+from discord.ext import commands
+import asyncio
+import functools
+import io
+import traceback
+import tracemalloc
+from typing import List, Literal, Optional
+from live_profiler import ProfileSession, format_snapshot
+
+
+class Profile(commands.Cog):
+    profile = app_commands.Group(
+        name="profile",
+        description="Profile the running bot",
+        default_permissions=discord.Permissions(administrator=True),
+        guild_only=True,
+    )
+
+    def __init__(self, client: commands.Bot) -> None:
+        self.client = client
+        self.session: Optional[ProfileSession] = None
+        self.timer: Optional[asyncio.Task] = None
+        self.interaction: Optional[Interaction] = None
+        self.command: Optional[app_commands.Command] = None
+        self.command_name: Optional[str] = None
+        self.original_callback = None
+        self.snapshots: List[tracemalloc.Snapshot] = []
+        self.snapshot_count = 0
+
+    async def cog_unload(self):
+        """Stop any running profiler and memory tracing when the cog is unloaded, e.g. by /refresh."""
+        if self.session:
+            await self.send_report(self.interaction, "Profiling ended early because the bot's commands were refreshed.")
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    async def is_developer(self, interaction: Interaction) -> bool:
+        """Check that the user is the developer, replying to them if not."""
+        if interaction.user.id != self.client.settings.developer:
+            await interaction.followup.send("Only the developer can use this command.")
+            return False
+        return True
+
+    def find_command(self, name: str) -> Optional[app_commands.Command]:
+        """Find an application command in the tree by its qualified name."""
+        return next((cmd for cmd in self.client.tree.walk_commands()
+                     if isinstance(cmd, app_commands.Command) and cmd.qualified_name == name), None)
+
+    def scope_to(self, command: app_commands.Command, session: ProfileSession) -> None:
+        """Wrap the command's handler so the session only profiles while it runs."""
+        # discord.py has no public hook around a single command's handler, and the tree calls
+        # the private _callback directly, so it is swapped out for the length of the session
+        original = command._callback
+
+        @functools.wraps(original)
+        async def profiled(*args, **kwargs):
+            return await session.profile_call(original(*args, **kwargs))
+
+        self.command = command
+        self.command_name = command.qualified_name
+        self.original_callback = original
+        command._callback = profiled
+
+    def end_session(self) -> ProfileSession:
+        """Stop the running session, restore any wrapped handler and return the stopped session."""
+        if self.timer and not self.timer.done() and self.timer is not asyncio.current_task():
+            self.timer.cancel()
+        self.timer = None
+        self.interaction = None
+
+        session, self.session = self.session, None
+        session.stop()
+
+        if self.command is not None:
+            self.command._callback = self.original_callback
+            # Reloading the command's cog replaces the command, so the new one was never wrapped
+            if self.find_command(self.command_name) is not self.command:
+                session.notes.append(
+                    f"/{self.command_name} was reloaded during the session; calls after the reload were not profiled.")
+            self.command = None
+            self.command_name = None
+            self.original_callback = None
+
+        return session
+
+    async def finish_session(self) -> str:
+        """Stop the running session and build its report without blocking the event loop."""
+        session = self.end_session()
+        return await self.client.loop.run_in_executor(None, session.report)
+
+    async def stop_later(self, interaction: Interaction, seconds: int):
+        """Stop the session after the given number of seconds and send the report."""
+        await asyncio.sleep(seconds)
+        await self.send_report(interaction, "Profiling finished.")
+
+    async def send_report(self, interaction: Interaction, content: str):
+        """Stop the session and send its report as a followup to the interaction that started it."""
+        try:
+            report = await self.finish_session()
+            await interaction.followup.send(content, file=self.make_file(report, "profile.txt"))
+        except Exception as error:
+            full_error = traceback.format_exception(type(error), error, error.__traceback__)
+            await self.client.send_error(full_error, interaction.guild, interaction.user, interaction.command)
+
+    def make_file(self, report: str, filename: str) -> discord.File:
+        """Create a Discord file from a text report."""
+        return discord.File(io.BytesIO(report.encode('utf-8')), filename=filename)
+
+    @profile.command(name="start", description="Start profiling for a number of seconds")
+    @app_commands.describe(
+        mode="Deterministic traces every call; sampling has lower overhead",
+        seconds="How long to profile for",
+        command="Only profile this command's handler, e.g. 'hello'",
+    )
+    async def start(self, interaction: Interaction, mode: Literal["deterministic", "sampling"],
+                    seconds: app_commands.Range[int, 1, 600], command: Optional[str] = None):
+        """Command to start the deterministic or sampling profiler."""
+        await interaction.response.defer(ephemeral=True)
+
+        if not await self.is_developer(interaction):
+            return
+
+        if self.session:
+            await interaction.followup.send("A profiling session is already running. Use `/profile stop` first.")
+            return
+
+        target = None
+        if command:
+            name = command.strip().lstrip('/')
+            target = self.find_command(name)
+            if target is None:
+                await interaction.followup.send(f"Command `/{name}` was not found.")
+                return
+
+        self.session = ProfileSession(mode, code=target._callback.__code__ if target else None)
+        if target is not None:
+            self.scope_to(target, self.session)
+        self.session.start()
+        self.interaction = interaction
+        self.timer = asyncio.create_task(self.stop_later(interaction, seconds))
+
+        scope = f"`/{target.qualified_name}`" if target else "the whole bot"
+        await interaction.followup.send(f"Profiling {scope} with the {mode} profiler for {seconds} seconds...")
+
+    @profile.command(name="stop", description="Stop profiling early and get the report")
+    async def stop(self, interaction: Interaction):
+        """Command to stop the running profiler."""
+        await interaction.response.defer(ephemeral=True)
+
+        if not await self.is_developer(interaction):
+            return
+
+        if not self.session:
+            await interaction.followup.send("No profiling session is running.")
+            return
+
+        report = await self.finish_session()
+        await interaction.followup.send("Profiling stopped.", file=self.make_file(report, "profile.txt"))
+
+    @profile.command(name="snapshot", description="Take a memory snapshot")
+    async def snapshot(self, interaction: Interaction):
+        """Command to take a tracemalloc snapshot, starting memory tracing if needed."""
+        await interaction.response.defer(ephemeral=True)
+
+        if not await self.is_developer(interaction):
+            return
+
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.snapshots.clear()
+            self.snapshot_count = 0
+            await interaction.followup.send((
+                "Memory tracing started. Only allocations made from now on are traced; "
+                "take another snapshot later and use `/profile diff` to compare them."
+            ))
+
+        # Keep only the two most recent snapshots for diffing
+        self.snapshots = self.snapshots[-1:] + [tracemalloc.take_snapshot()]
+        self.snapshot_count += 1
+        # Only taking the snapshot has to happen on the event loop; analysing it can be slow
+        report = await self.client.loop.run_in_executor(None, format_snapshot, self.snapshots[-1])
+        await interaction.followup.send(
+            f"Snapshot {self.snapshot_count} taken.", file=self.make_file(report, "snapshot.txt"))
+
+    @profile.command(name="diff", description="Compare the last two memory snapshots")
+    async def diff(self, interaction: Interaction):
+        """Command to diff the two most recent tracemalloc snapshots."""
+        await interaction.response.defer(ephemeral=True)
+
+        if not await self.is_developer(interaction):
+            return
+
+        if len(self.snapshots) < 2:
+            await interaction.followup.send("Take two snapshots with `/profile snapshot` first.")
+            return
+
+        report = await self.client.loop.run_in_executor(None, format_snapshot, self.snapshots[-1], self.snapshots[-2])
+        await interaction.followup.send("Snapshot diff:", file=self.make_file(report, "snapshot_diff.txt"))
+
+    @profile.command(name="reset", description="Stop memory tracing and discard snapshots")
+    async def reset(self, interaction: Interaction):
+        """Command to stop tracemalloc and free its snapshots."""
+        await interaction.response.defer(ephemeral=True)
+
+        if not await self.is_developer(interaction):
+            return
+
+        self.snapshots.clear()
+        self.snapshot_count = 0
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+        await interaction.followup.send("Memory tracing stopped.")
+
+
+async def setup(client: commands.Bot) -> None:
+    """Function to set up the Profile cog."""
+    await client.add_cog(Profile(client))
@@ -1,19 +1,12 @@
 from discord import Interaction
 from discord.ext import commands
 from jsonDB import JsonDB
-import os
-from dotenv import load_dotenv
-from typing import Optional
-
-# Load environment variables from a .env file
-load_dotenv()
-DATABASE: Optional[str] = os.getenv('DATABASE')
 
 
 class Utils:
     def __init__(self, client: commands.Bot) -> None:
         self.client = client
-        self.db = JsonDB(DATABASE)  # Initialize the JSON database
+        self.db = JsonDB(client.settings.database)  # Initialize the JSON database
 
     async def logger(self, interaction: Interaction, **kwargs):
         """Log the interaction details to the log channel."""
@@ -0,0 +1,254 @@
+import cProfile
+import io
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from types import CodeType
+from typing import Any, Coroutine, Generator, List, Optional
+
+
+class SamplingProfiler:
+    """Statistical profiler that samples the stack of one thread from a background thread."""
+
+    def __init__(self, interval: float = 0.005, code: Optional[CodeType] = None) -> None:
+        """
+        Initializes the sampler. No thread is started until start() is called.
+
+        :param interval: The number of seconds between two samples.
+        :param code: Optional code object; samples are only recorded while it is executing on the stack.
+        """
+        self.interval = interval
+        self.code = code
+        self.samples = 0
+        self.own: Counter = Counter()
+        self.cumulative: Counter = Counter()
+        self._target = threading.get_ident()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Starts sampling the thread that called this method."""
+        self._target = threading.get_ident()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops sampling and waits for the sampler thread to exit."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._target)
+            if frame is None:
+                continue
+
+            stack = []
+            while frame is not None:
+                stack.append(frame.f_code)
+                if frame.f_code is self.code:
+                    break
+                frame = frame.f_back
+            else:
+                # A suspended coroutine is not on the stack, so this skips time spent awaiting
+                if self.code is not None:
+                    continue
+
+            self.samples += 1
+            self.own[self._describe(stack[0])] += 1
+            for location in {self._describe(code) for code in stack}:
+                self.cumulative[location] += 1
+
+    @staticmethod
+    def _describe(code: CodeType) -> str:
+        return f"{code.co_filename}:{code.co_firstlineno}({code.co_name})"
+
+    def report(self, limit: int = 30) -> str:
+        """
+        Builds a plain-text report of the most frequently sampled functions.
+
+        :param limit: The number of functions to include in each table.
+        :return: The formatted report.
+        """
+        lines = [f"{self.samples} samples every {self.interval * 1000:.1f} ms", ""]
+        for title, counter in (("Own samples", self.own), ("Cumulative samples", self.cumulative)):
+            lines.append(f"{title}:")
+            for location, count in counter.most_common(limit):
+                share = count / self.samples * 100 if self.samples else 0.0
+                lines.append(f"  {count:7d} {share:6.1f}%  {location}")
+            lines.append("")
+        return "\n".join(lines)
+
+
+class _ProfiledCoroutine:
+    """Drives a coroutine with the profiler enabled only while the coroutine itself is executing."""
+
+    def __init__(self, coro: Coroutine, session: "ProfileSession") -> None:
+        self._coro = coro
+        self._session = session
+
+    def __await__(self) -> Generator[Any, Any, Any]:
+        value, error = None, None
+        while True:
+            self._session._resume()
+            try:
+                if error is not None:
+                    yielded = self._coro.throw(error)
+                else:
+                    yielded = self._coro.send(value)
+            except StopIteration as stop:
+                return stop.value
+            finally:
+                self._session._suspend()
+
+            # Whatever the event loop runs while the coroutine is suspended is not profiled
+            try:
+                value, error = (yield yielded), None
+            except GeneratorExit:
+                self._coro.close()
+                raise
+            except BaseException as exc:
+                value, error = None, exc
+
+
+class ProfileSession:
+    """A single run of the deterministic or sampling profiler against the live process."""
+
+    MODES = ("deterministic", "sampling")
+
+    def __init__(self, mode: str, code: Optional[CodeType] = None, limit: int = 30) -> None:
+        """
+        Initializes the session. Nothing is profiled until start() is called.
+
+        :param mode: Either 'deterministic' (cProfile) or 'sampling'.
+        :param code: The code object of a command handler to limit profiling to, or None to profile everything.
+        :param limit: The number of entries to include in the report.
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown profiling mode: {mode}")
+        self.mode = mode
+        self.code = code
+        self.limit = limit
+        self.calls = 0
+        self.started = 0.0
+        self.elapsed = 0.0
+        self.notes: List[str] = []
+        self.stopped = False
+        self._active = 0
+        self._profile: Optional[cProfile.Profile] = None
+        self._sampler: Optional[SamplingProfiler] = None
+
+    @property
+    def scoped(self) -> bool:
+        """Whether the session only profiles a single command handler."""
+        return self.code is not None
+
+    def start(self) -> None:
+        """Starts the session. Unscoped sessions begin profiling immediately."""
+        self.started = time.perf_counter()
+        if self.mode == "deterministic":
+            self._profile = cProfile.Profile()
+            if not self.scoped:
+                self._profile.enable()
+        else:
+            self._sampler = SamplingProfiler(code=self.code)
+            self._sampler.start()
+
+    def profile_call(self, coro: Coroutine):
+        """
+        Wraps one call of the scoped handler so that only its own execution is profiled.
+
+        :param coro: The coroutine returned by the handler.
+        :return: An awaitable producing the handler's result.
+        """
+        if self.stopped:
+            return coro
+        self.calls += 1
+        if self._profile is None:
+            # The sampler already filters on the handler's code object
+            return coro
+        return _ProfiledCoroutine(coro, self)
+
+    # Handlers still in flight when the session stops keep their wrapper, so both of these
+    # must do nothing afterwards rather than turn the stopped profiler back on
+    def _resume(self) -> None:
+        if self.stopped:
+            return
+        self._active += 1
+        if self._active == 1 and self._profile is not None:
+            self._profile.enable()
+
+    def _suspend(self) -> None:
+        if self.stopped:
+            return
+        self._active -= 1
+        if self._active == 0 and self._profile is not None:
+            self._profile.disable()
+
+    def stop(self) -> None:
+        """Stops collecting samples or calls. The report is built separately by report()."""
+        self.stopped = True
+        self.elapsed = time.perf_counter() - self.started
+        if self._profile is not None:
+            self._profile.disable()
+        else:
+            self._sampler.stop()
+
+    def report(self) -> str:
+        """
+        Builds the report of a stopped session. This can be slow, so it is safe to run in an executor.
+
+        :return: The formatted report.
+        """
+        header = f"{self.mode.capitalize()} profile over {self.elapsed:.1f} s"
+        if self.scoped:
+            header += f", {self.calls} profiled call(s)"
+        for note in self.notes:
+            header += f"\n{note}"
+
+        if self._profile is not None:
+            stream = io.StringIO()
+            stats = pstats.Stats(self._profile, stream=stream)
+            stats.sort_stats("cumulative").print_stats(self.limit)
+            stream.write("\n")
+            stats.sort_stats("tottime").print_stats(self.limit)
+            body = stream.getvalue()
+        else:
+            body = self._sampler.report(self.limit)
+
+        return f"{header}\n\n{body}"
+
+
+def format_snapshot(snapshot: tracemalloc.Snapshot, previous: Optional[tracemalloc.Snapshot] = None, limit: int = 30) -> str:
+    """
+    Builds a plain-text report of the top allocation sites, or of the growth since a previous snapshot.
+
+    :param snapshot: The snapshot to report on.
+    :param previous: An older snapshot to diff against, if any.
+    :param limit: The number of allocation sites to include.
+    :return: The formatted report.
+    """
+    filters = [
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    ]
+    snapshot = snapshot.filter_traces(filters)
+
+    if previous is None:
+        stats = snapshot.statistics("lineno")
+        total = sum(stat.size for stat in stats)
+        lines = [f"Top allocation sites, {total / 1024:.1f} KiB traced", ""]
+    else:
+        stats = snapshot.compare_to(previous.filter_traces(filters), "lineno")
+        growth = sum(stat.size_diff for stat in stats)
+        lines = [f"Allocation changes since previous snapshot, {growth / 1024:+.1f} KiB", ""]
+
+    lines.extend(f"  {stat}" for stat in stats[:limit])
+    return "\n".join(lines)
@@ -1,47 +1,52 @@
-import discord
-from discord.ext import commands
-from discord import app_commands
-import traceback
-import os
-from dotenv import load_dotenv
-from typing import List, Optional
-import pathlib
+from settings import Settings
+from profiler import StartupProfiler
 
-# Load environment variables from a .env file
-load_dotenv()
+# Load settings once and start timing imports before the heavy modules are loaded
+settings = Settings.load()
+profiler = StartupProfiler(enabled=settings.profile_startup)
+profiler.install()
 
-# Retrieve the bot token and developer ID from environment variables
-TOKEN: Optional[str] = os.getenv('TOKEN')
-DEVELOPER: Optional[int] = int(os.getenv('DEVELOPER')) if os.getenv('DEVELOPER') else None
-
-# Define base directory and cog directory paths
-BASE_DIR = pathlib.Path(__file__).parent
-COG_DIR = BASE_DIR / "cogs"
+import discord  # noqa: E402
+from discord.ext import commands  # noqa: E402
+from discord import app_commands  # noqa: E402
+import traceback  # noqa: E402
+from contextlib import nullcontext  # noqa: E402
+from typing import List, Optional  # noqa: E402
 
 
 class Client(commands.Bot):
-    def __init__(self) -> None:
+    def __init__(self, settings: Settings, profiler: Optional[StartupProfiler] = None) -> None:
         super().__init__(command_prefix=commands.when_mentioned_or("?"), intents=discord.Intents.all())
+        self.settings = settings
+        self.profiler = profiler or StartupProfiler()
         self.remove_command('help')  # Remove default help command
         self.tree.on_error = self.on_tree_error  # Set tree command error handler
 
     async def setup_hook(self) -> None:
         """Load extensions (cogs) during bot setup."""
-        for cog_file in COG_DIR.glob("*.py"):
-            if cog_file.stem not in ["__init__", "Utils"]:
-                await self.load_extension(f"cogs.{cog_file.stem}")
+        for extension in self.settings.extensions:
+            with self.profiler.phase(f"setup_hook: load {extension}"):
+                await self.load_extension(extension)
 
     async def on_ready(self) -> None:
         """Called when the bot is ready."""
-        await self.tree.sync()  # Sync application commands with Discord
+        first_ready = self.profiler.enabled and self.profiler.ready is None
+        self.profiler.mark_ready()
+
+        # on_ready fires again on reconnects; only the first sync belongs in the startup profile
+        with self.profiler.phase("on_ready: tree sync") if first_ready else nullcontext():
+            await self.tree.sync()  # Sync application commands with Discord
 
         await self.change_presence(activity=discord.Activity(type=discord.ActivityType.listening, name="commands"))
 
         print("\nBot is online.\n")
 
+        if first_ready:
+            print(self.profiler.report())
+
     async def send_error(self, error: List[str], guild: Optional[discord.Guild], user: discord.User, command: discord.app_commands.Command) -> None:
         """Send error details to the developer."""
-        dev: Optional[discord.User] = self.get_user(DEVELOPER) or await self.fetch_user(DEVELOPER)
+        dev: Optional[discord.User] = self.get_user(self.settings.developer) or await self.fetch_user(self.settings.developer)
 
         if not dev:
             return
@@ -105,11 +110,11 @@ class Client(commands.Bot):
 
 def main() -> None:
     """Main entry point for the bot."""
-    if not TOKEN:
+    if not settings.token:
         raise ValueError("TOKEN environment variable not set")
 
-    client = Client()
-    client.run(TOKEN)
+    client = Client(settings, profiler)
+    client.run(settings.token)
 
 
 if __name__ == "__main__":
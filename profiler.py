@@ -0,0 +1,151 @@
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+
+
+class _TimedLoader:
+    """Wraps a module loader to measure how long the module takes to execute."""
+
+    def __init__(self, loader, profiler: "StartupProfiler") -> None:
+        self._loader = loader
+        self._profiler = profiler
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module) -> None:
+        # Hand the real loader back to the module so nothing downstream sees the wrapper
+        module.__loader__ = self._loader
+        if module.__spec__ is not None:
+            module.__spec__.loader = self._loader
+
+        self._profiler._import_started()
+        start = time.perf_counter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler._import_finished(module.__name__, time.perf_counter() - start)
+
+
+class _ImportTimer:
+    """Meta path finder that wraps the loader of every module imported while installed."""
+
+    # Only find_spec is needed on sys.meta_path; subclassing importlib.abc.MetaPathFinder would
+    # pull importlib.resources into every cold start
+
+    def __init__(self, profiler: "StartupProfiler") -> None:
+        self._profiler = profiler
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is None:
+                continue
+            if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                spec.loader = _TimedLoader(spec.loader, self._profiler)
+            return spec
+        return None
+
+
+class StartupProfiler:
+    """Records import times, startup phases and the time until the bot is ready."""
+
+    def __init__(self, enabled: bool = False) -> None:
+        """
+        Initializes the profiler. Nothing is recorded unless the profiler is enabled.
+
+        :param enabled: Whether startup timings should be collected and reported.
+        """
+        self.enabled = enabled
+        self.start = time.perf_counter()
+        self.imports: Dict[str, Tuple[float, float]] = {}
+        self.phases: List[Tuple[str, float]] = []
+        self.ready: Optional[float] = None
+        self._finder: Optional[_ImportTimer] = None
+        # Per-thread stack of nested import times, as imports can also happen in executor threads
+        self._child_time = threading.local()
+
+    def install(self) -> None:
+        """Starts timing every module imported from now on."""
+        if not self.enabled or self._finder is not None:
+            return
+        self._finder = _ImportTimer(self)
+        sys.meta_path.insert(0, self._finder)
+
+    def uninstall(self) -> None:
+        """Stops timing imports."""
+        if self._finder is None:
+            return
+        sys.meta_path.remove(self._finder)
+        self._finder = None
+
+    def _import_started(self) -> None:
+        if not hasattr(self._child_time, "stack"):
+            self._child_time.stack = []
+        self._child_time.stack.append(0.0)
+
+    def _import_finished(self, name: str, elapsed: float) -> None:
+        # Self time excludes the time spent importing nested modules
+        stack = self._child_time.stack
+        children = stack.pop()
+        if stack:
+            stack[-1] += elapsed
+        self.imports[name] = (elapsed, elapsed - children)
+
+    @contextmanager
+    def phase(self, name: str):
+        """
+        Context manager that records how long the wrapped block takes.
+
+        :param name: The label the phase is reported under.
+        """
+        if not self.enabled:
+            yield
+            return
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, time.perf_counter() - start))
+
+    def mark_ready(self) -> None:
+        """Records the time to on_ready and stops timing imports. Only the first call counts."""
+        if not self.enabled or self.ready is not None:
+            return
+        self.ready = time.perf_counter() - self.start
+        self.uninstall()
+
+    def report(self, limit: int = 20) -> str:
+        """
+        Builds a plain-text report of the recorded timings.
+
+        :param limit: The number of slowest imports to include.
+        :return: The formatted report.
+        """
+        lines = ["Startup profile", ""]
+
+        total_imports = sum(self_time for _, self_time in self.imports.values())
+        lines.append(f"Imports: {len(self.imports)} modules, {total_imports * 1000:.1f} ms")
+        lines.append(f"  {'self ms':>9} {'cumul ms':>9}  module")
+        slowest = sorted(self.imports.items(), key=lambda item: item[1][1], reverse=True)[:limit]
+        for name, (cumulative, self_time) in slowest:
+            lines.append(f"  {self_time * 1000:9.1f} {cumulative * 1000:9.1f}  {name}")
+
+        lines.append("")
+        lines.append("Phases:")
+        for name, elapsed in self.phases:
+            lines.append(f"  {elapsed * 1000:9.1f} ms  {name}")
+
+        if self.ready is not None:
+            lines.append("")
+            lines.append(f"Time to on_ready: {self.ready * 1000:.1f} ms")
+
+        return "\n".join(lines)
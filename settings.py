@@ -0,0 +1,54 @@
+import os
+import pathlib
+from dataclasses import dataclass
+from typing import List, Optional
+
+from dotenv import load_dotenv
+
+# Define base directory and cog directory paths
+BASE_DIR = pathlib.Path(__file__).parent
+COG_DIR = BASE_DIR / "cogs"
+
+# Cog modules that are helpers rather than loadable extensions
+IGNORED_COGS = ["__init__", "Utils"]
+
+
+@dataclass(frozen=True)
+class Settings:
+    """Bot configuration, loaded once at startup and shared through the client."""
+
+    token: Optional[str]
+    developer: Optional[int]
+    database: Optional[str]
+    profile_startup: bool = False
+    cog_dir: pathlib.Path = COG_DIR
+
+    @classmethod
+    def load(cls) -> "Settings":
+        """
+        Loads the settings from the environment, reading a .env file first if one exists.
+
+        :return: A Settings instance built from the environment variables.
+        """
+        load_dotenv()
+
+        developer = os.getenv('DEVELOPER')
+        return cls(
+            token=os.getenv('TOKEN'),
+            developer=int(developer) if developer else None,
+            database=os.getenv('DATABASE'),
+            profile_startup=os.getenv('PROFILE_STARTUP', '').lower() in ('1', 'true', 'yes'),
+        )
+
+    @property
+    def extensions(self) -> List[str]:
+        """
+        Returns the dotted names of every cog extension in the cog directory.
+
+        :return: A list of extension names such as 'cogs.Basic'.
+        """
+        return [
+            f"cogs.{cog_file.stem}"
+            for cog_file in sorted(self.cog_dir.glob("*.py"))
+            if cog_file.stem not in IGNORED_COGS
+        ]
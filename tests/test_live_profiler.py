@@ -0,0 +1,50 @@
+import asyncio
+import pstats
+import unittest
+
+from live_profiler import ProfileSession
+
+
+def work():
+    return sum(i * i for i in range(20000))
+
+
+class ScopedSessionTests(unittest.IsolatedAsyncioTestCase):
+    async def test_stop_while_handler_is_suspended(self):
+        """A handler resuming after the session stopped must not turn the profiler back on."""
+        resume = asyncio.Event()
+
+        async def handler():
+            work()
+            await resume.wait()
+            for _ in range(5):
+                work()
+
+        session = ProfileSession("deterministic", code=handler.__code__)
+        session.start()
+
+        async def wrapped():
+            return await session.profile_call(handler())
+
+        task = asyncio.create_task(wrapped())
+        await asyncio.sleep(0)  # Let the handler run up to its await
+
+        session.stop()
+        calls_at_stop = pstats.Stats(session._profile).total_calls
+
+        resume.set()
+        await task
+
+        self.assertEqual(pstats.Stats(session._profile).total_calls, calls_at_stop)
+        self.assertEqual(session.calls, 1)
+
+        # A second session has to be able to take over the profiling hook
+        second = ProfileSession("deterministic")
+        second.start()
+        work()
+        second.stop()
+        self.assertIn("work", second.report())
+
+
+if __name__ == "__main__":
+    unittest.main()